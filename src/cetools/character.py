@@ -3,19 +3,19 @@ from typing import (Dict, List, Optional, Type)
 import attr
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Skill:
     name: str
     rank: Optional[int]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Rank:
     name: str
     skill: Optional[Skill]
 
 
-@attr.s(auto_attribs=True)
+@attr.s(auto_attribs=True, slots=True)
 class Character:
     name: str
     strength: int
@@ -29,7 +29,7 @@ class Character:
     skills: Dict[str, int]
 
 
-@attr.s(auto_attribs=True, frozen=True)
+@attr.s(auto_attribs=True, frozen=True, slots=True)
 class Career:
     name: str
     qualifications: Dict[str, int]
@@ -0,0 +1,102 @@
+import pytest
+
+from cetools import utils
+
+BASELINE_PSEUDO_HEX = {
+    0: "0",
+    1: "1",
+    2: "2",
+    3: "3",
+    4: "4",
+    5: "5",
+    6: "6",
+    7: "7",
+    8: "8",
+    9: "9",
+    10: "A",
+    11: "B",
+    12: "C",
+    13: "D",
+    14: "E",
+    15: "F",
+    16: "G",
+    17: "H",
+    18: "J",
+    19: "K",
+    20: "L",
+    21: "M",
+    22: "N",
+    23: "P",
+    24: "Q",
+    25: "R",
+    26: "S",
+    27: "T",
+    28: "U",
+    29: "V",
+    30: "W",
+    31: "X",
+    32: "Y",
+    33: "Z",
+}
+
+
+def test_pseudo_hex_matches_baseline():
+    assert len(utils.PSEUDO_HEX) == len(BASELINE_PSEUDO_HEX)
+    for value, digit in BASELINE_PSEUDO_HEX.items():
+        assert utils.PSEUDO_HEX[value] == digit
+        assert utils.dec_to_pseudo_hex(value) == digit
+
+
+def test_pseudo_hex_skips_i_and_o():
+    assert "I" not in utils.PSEUDO_HEX
+    assert "O" not in utils.PSEUDO_HEX
+
+
+@pytest.mark.parametrize("value", [-2, -1, 34, 100])
+def test_dec_to_pseudo_hex_out_of_range(value):
+    with pytest.raises(ValueError):
+        utils.dec_to_pseudo_hex(value)
+
+
+def test_pseudo_hex_index_past_end():
+    with pytest.raises(IndexError):
+        utils.PSEUDO_HEX[34]
+
+
+def test_roll_d6_range():
+    assert {utils.roll_d6() for _ in range(600)} <= set(range(1, 7))
+
+
+@pytest.mark.parametrize("num", [1, 2, 3, 10])
+def test_roll_nd6_range(num):
+    for _ in range(200):
+        assert num <= utils.roll_nd6(num) <= 6 * num
+
+
+def test_roll_nd6_zero_dice():
+    assert utils.roll_nd6(0) == 0
+
+
+def test_roll_d66_digits():
+    for _ in range(600):
+        tens, units = divmod(utils.roll_d66(), 10)
+        assert 1 <= tens <= 6
+        assert 1 <= units <= 6
+
+
+class FixedRandom:
+    """Stand-in for utils.RAND that always picks the highest face."""
+
+    def choice(self, seq):
+        return seq[-1]
+
+    def choices(self, population, k=1):
+        return [population[-1]] * k
+
+
+def test_rolls_use_patched_rand(monkeypatch):
+    # roll_nd6 draws from RAND directly, so patch RAND rather than roll_d6.
+    monkeypatch.setattr(utils, "RAND", FixedRandom())
+    assert utils.roll_d6() == 6
+    assert utils.roll_nd6(3) == 18
+    assert utils.roll_d66() == 66